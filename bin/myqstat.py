@@ -251,9 +251,10 @@ class Main:
                     f"\x1b[1;35mMyQS PGID        = {info['PGID']}\x1b[0m"
                 )
 
+        width = options.get_width()
         for message in [Message(x) for x in info['LINES']]:
-            if message.width() > options.get_width():
-                message = message.get(options.get_width(), lcut=True)
+            if message.width() > width:
+                message = message.get(width, lcut=True)
             lines.append(f"\x1b[1;34m{message}\x1b[0m")
         return lines
 
@@ -269,15 +270,24 @@ class Main:
              if options.get_all_flag() or jobids else
              ('QUEUE',)
         )
+        try:
+            files = {x.name for x in os.scandir(self._myqsdir)}
+        except OSError:
+            files = set()
         if not jobids:
-            jobids = sorted(
-                [int(x.stem) for x in self._myqsdir.glob('*.[dfqr]')]
-            )
+            jobids = list({
+                int(x[:-2])
+                for x in files
+                if x[-2:] in ('.d', '.f', '.q', '.r') and x[:-2].isdigit()
+            })
+        suffixes = [(mode, f'.{mode[0].lower()}') for mode in modes]
 
         status = Status()
         for jobid in sorted(jobids):
-            for mode in modes:
-                path = Path(self._myqsdir, f'{jobid}.{mode[0].lower()}')
+            for mode, suffix in suffixes:
+                path = Path(self._myqsdir, f'{jobid}{suffix}')
+                if path.name not in files and not path.is_file():
+                    continue
                 info = self._get_info(path)
                 if info:
                     job_name = Message(info.get('JOBNAME')).get(45, lcut=True)
@@ -290,7 +300,10 @@ class Main:
                         ] + self._get_lines(info, options)
                     )
                     continue
-            info = self._get_info(Path(self._myqsdir, f'{jobid}.r'))
+            path = Path(self._myqsdir, f'{jobid}.r')
+            if path.name not in files and not path.is_file():
+                continue
+            info = self._get_info(path)
             if info:
                 job_name = Message(info.get('JOBNAME')).get(45, lcut=True)
                 pgid = int(info.get('PGID', '0'))
@@ -5,6 +5,7 @@ MyQS, My Queuing System batch job submission.
 
 import argparse
 import os
+import random
 import signal
 import socket
 import sys
@@ -193,6 +194,7 @@ class Main:
         return jobid
 
     def _lock(self) -> Path:
+        delay = 0.01
         while True:
             path = Path(self._myqsdir, 'myqsub.pid')
             if path.is_file():
@@ -218,7 +220,8 @@ class Main:
                         f"{sys.argv[0]}: MyQS cannot create lock: {path}"
                     ) from exception
                 break
-            time.sleep(1)
+            time.sleep(delay * (0.5 + random.random()))  # Jitter backoff
+            delay = min(delay * 2, 1.)
         return path
 
     def _has_myqsd(self) -> bool:
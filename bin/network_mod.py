@@ -5,6 +5,7 @@ Python network handling utility module
 Copyright GPL v2: 2015-2024 By Dr Colin Kong
 """
 
+import functools
 import getpass
 import glob
 import grp
@@ -47,16 +48,26 @@ class NetNice(Command):
             if self._drate:
                 self.extend_args(['-d', self._drate / 8])
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _load(
+        path: Path,
+        mtime: float,  # pylint: disable=unused-argument
+    ) -> Any:
+        """
+        Return parsed JSON data (shared by callers so do not modify).
+        """
+        return json.loads(path.read_text(errors='replace'))
+
     def _read(self, path: Path) -> None:
         """
-        Read configuration file
+        Read configuration file (cached until modification time changes)
         """
-        if path.is_file():
-            try:
-                data = json.loads(path.read_text(errors='replace'))
-                self._drate = data['trickle']['download']
-            except (KeyError, OSError, ValueError):
-                pass
+        try:
+            data = self._load(path, path.stat().st_mtime)
+            self._drate = data['trickle']['download']
+        except (KeyError, OSError, TypeError, ValueError):
+            pass
 
     def _write(self, path: Path) -> None:
         """
@@ -4,6 +4,7 @@ Set the date and time via NTP pool
 """
 
 import argparse
+import concurrent.futures
 import glob
 import logging
 import math
@@ -140,26 +141,31 @@ class Main:
             except dns.exception.DNSException:
                 yield 'none'
 
+    @classmethod
+    def _request(cls) -> ntplib.NTPStats:
+        return ntplib.NTPClient().request(next(cls.get_server()), version=3)
+
     @classmethod
     def get_offset(cls) -> float:
         """
-        Determine NTP offset
+        Determine NTP offset (probes are sent in parallel)
         """
-        client = ntplib.NTPClient()
         offsets = []
         logger.info("Connecting to NTP server...")
-        for _ in range(NTP_SYNC_MAX):
-            try:
-                response = client.request(next(cls.get_server()), version=3)
-            except (socket.gaierror, ntplib.NTPException):
-                logger.info("Offset:    ?.?????????  (???.???.???.???)")
-            else:
-                logger.info(
-                    "Offset:   %12.9f  (%s)",
-                    response.offset,
-                    ntplib.ref_id_to_text(response.ref_id),
-                )
-                offsets.append(response.offset)
+        with concurrent.futures.ThreadPoolExecutor(NTP_SYNC_MAX) as pool:
+            futures = [pool.submit(cls._request) for _ in range(NTP_SYNC_MAX)]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    response = future.result()
+                except (socket.gaierror, ntplib.NTPException):
+                    logger.info("Offset:    ?.?????????  (???.???.???.???)")
+                else:
+                    logger.info(
+                        "Offset:   %12.9f  (%s)",
+                        response.offset,
+                        ntplib.ref_id_to_text(response.ref_id),
+                    )
+                    offsets.append(response.offset)
 
         if len(offsets) >= NTP_SYNC_MIN:
             mean = statistics.mean(offsets)
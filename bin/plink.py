@@ -8,10 +8,9 @@ import os
 import signal
 import sys
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Tuple
 
 from config_mod import Config
-from file_mod import FileStat
 
 
 class Options:
@@ -104,43 +103,58 @@ class Main:
             Path.open = _open  # type: ignore
 
     @staticmethod
-    def run() -> int:
+    def _get_files(
+        directory: str,
+        extensions: FrozenSet[str],
+    ) -> List[Tuple['os.DirEntry[str]', str]]:
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                ext = entry.name[entry.name.rfind('.'):].lower()
+                if ext in extensions and entry.is_file():
+                    files.append((entry, ext))
+        return sorted(files, key=lambda x: x[0].name)
+
+    @staticmethod
+    def _create_link(file: 'os.DirEntry[str]', link: Path) -> None:
+        try:
+            link.symlink_to(file.path)
+        except OSError as exception:
+            if isinstance(exception, FileExistsError) and link.is_symlink():
+                return
+            raise SystemExit(
+                f'{sys.argv[0]}: Cannot create "{link}" link.',
+            ) from exception
+        file_time = file.stat().st_mtime
+        try:
+            os.utime(link, (file_time, file_time), follow_symlinks=False)
+        except NotImplementedError:
+            pass
+
+    @classmethod
+    def run(cls) -> int:
         """
         Start program
         """
         options = Options()
         depth = options.get_depth()
         config = Config()
-        images_extensions = (
+        images_extensions = frozenset(
+            x.lower()
+            for x in
             config.get('image_extensions') + config.get('video_extensions')
         )
 
+        with os.scandir() as entries:
+            links = {x.name for x in entries if x.is_symlink()}
+
         for album, directory in enumerate(options.get_directories()):
             linkdir = '_'.join(directory.split(os.sep)[-depth:])
-            for number, file in enumerate(sorted([
-                x
-                for x in Path(directory).glob('*.*')
-                if x.suffix.lower() in images_extensions
-            ])):
-                ext = Path(file).suffix.lower()
-                if ext in images_extensions:
-                    link = Path(f'{album+1:02d}.{number+1:03d}_{linkdir}{ext}')
-                    if not link.is_symlink():
-                        try:
-                            link.symlink_to(file)
-                        except OSError as exception:
-                            raise SystemExit(
-                                f'{sys.argv[0]}: Cannot create "{link}" link.',
-                            ) from exception
-                        file_time = FileStat(file).get_mtime()
-                        try:
-                            os.utime(
-                                link,
-                                (file_time, file_time),
-                                follow_symlinks=False,
-                            )
-                        except NotImplementedError:
-                            pass
+            files = cls._get_files(directory, images_extensions)
+            for number, (file, ext) in enumerate(files):
+                link = Path(f'{album+1:02d}.{number+1:03d}_{linkdir}{ext}')
+                if link.name not in links:
+                    cls._create_link(file, link)
 
         return 0
 
@@ -107,25 +107,39 @@ class Main:
         return sorted(paths)
 
     @staticmethod
-    def _rename(paths: List[Path]) -> None:
+    def _rename(directory: Path, paths: List[Path]) -> None:
+        """
+        Only renames to names already in use need the temporary name phase.
+        """
+        names = {x.casefold() for x in os.listdir(directory)}
         paths_new = []
 
         number = 1
         for path in paths:
             extension = path.suffix.lower().replace('.jpeg', '.jpg')
-            path_new = Path(f'pic{number:05d}{extension}')
+            path_new = Path(directory, f'pic{number:05d}{extension}')
+            number += 1
+            if path.name == path_new.name:
+                continue
+            if path_new.name.casefold() not in names:
+                try:
+                    path.replace(path_new)
+                except OSError as exception:
+                    raise SystemExit(
+                        f'{sys.argv[0]}: Cannot rename "{path}" image file.',
+                    ) from exception
+                continue
             paths_new.append(path_new)
             try:
-                path.replace(f'pnum.tmp-{path_new}')
+                path.replace(Path(directory, f'pnum.tmp-{path_new.name}'))
             except OSError as exception:
                 raise SystemExit(
                     f'{sys.argv[0]}: Cannot rename "{path}" image file.',
                 ) from exception
-            number += 1
 
         for path in paths_new:
             try:
-                Path(f'pnum.tmp-{path}').replace(path)
+                Path(directory, f'pnum.tmp-{path.name}').replace(path)
             except OSError as exception:
                 raise SystemExit(
                     f'{sys.argv[0]}: Cannot rename to '
@@ -147,28 +161,29 @@ class Main:
         """
         options = Options()
 
-        startdir = os.getcwd()
         config = Config()
-        images_extensions = (
+        images_extensions = tuple(
+            x.lower()
+            for x in
             config.get('image_extensions') + config.get('video_extensions')
         )
 
         isvalid = re.compile(r'pic\d{5}\.')
         for path in [x for x in options.get_directories() if x.is_dir()]:
-            os.chdir(path)
-            paths = sorted([
-                x
-                for x in Path().glob('*.*')
-                if x.suffix.lower() in images_extensions
-            ])
+            with os.scandir(path) as entries:
+                paths = sorted([
+                    Path(x.path)
+                    for x in entries
+                    if x.name.lower().endswith(images_extensions)
+                    and x.is_file()
+                ])
             paths_valid = [x for x in paths if isvalid.match(x.name)]
             paths_sorted = self._sorted(options, paths)
             missing = paths and paths[-1].stem != f'pic{len(paths):05d}'
             if paths != paths_valid or paths != paths_sorted or missing:
                 print(f"Renaming image files: {path}")
-                self._rename(paths_sorted)
-                self._set_time(Path())
-            os.chdir(startdir)
+                self._rename(path, paths_sorted)
+                self._set_time(path)
 
         return 0
 
@@ -4,25 +4,24 @@ Calculate checksum lines using imagehash, file size and file modification time.
 """
 
 import argparse
-import itertools
+import concurrent.futures
+import io
 import logging
 import os
+import re
 import signal
 import sys
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Any, Generator, List, Optional, Sequence, Set, Tuple, Union
 
-# pylint: disable=import-error
-import imagehash  # type: ignore
-import PIL  # type: ignore
-import pybktree  # type: ignore
+# pylint: disable=import-error,import-outside-toplevel
 import pyzstd  # type: ignore
 
 from command_mod import Command
-from file_mod import FileStat
 from logging_mod import ColoredFormatter
 
 MAX_DISTANCE_IDENTICAL = 6
+SMALL_IMAGE_SIZE = 16777216
 
 logger = logging.getLogger(__name__)
 console_handler = logging.StreamHandler()
@@ -99,6 +98,7 @@ class Main:
     """
     Main class
     """
+    _ischecksum = re.compile(r'^([^/\n]*)/(-?\d+)/(-?\d+)  (.+)$', re.M)
 
     def __init__(self) -> None:
         try:
@@ -123,16 +123,6 @@ class Main:
                 return open(str(file), *args, **kwargs)
             Path.open = _open  # type: ignore
 
-    @staticmethod
-    def _get_checksum(line: str) -> Tuple[str, int, int, str]:
-        i = line.find('  ')
-        try:
-            checksum, size, mtime = line[:i].split('/')
-            file = line[i+2:]
-            return checksum, int(size), int(mtime), file
-        except ValueError:
-            return '', -1, -1, ''
-
     @classmethod
     def _read(cls, path: Path) -> dict:
         logger.info("Reading checksum file: %s", path)
@@ -141,22 +131,90 @@ class Main:
                 f"{sys.argv[0]}: Cannot find checksum file: {path}",
             )
 
-        images_phashes = {}
         try:
             with pyzstd.open(path, 'rt', errors='replace') as ifile:
-                for line in ifile:
-                    try:
-                        line = line.rstrip('\n')
-                        checksum, size, mtime, file = cls._get_checksum(line)
-                        if file:
-                            images_phashes[(file, size, mtime)] = checksum
-                    except IndexError:
-                        pass
+                data = ifile.read()
         except OSError as exception:
             raise SystemExit(
                 f"{sys.argv[0]}: Cannot read checksum file: {path}",
             ) from exception
-        return images_phashes
+
+        return {
+            (match[4], int(match[2]), int(match[3])): match[1]
+            for match in cls._ischecksum.finditer(data)
+        }
+
+    @staticmethod
+    def _scandir(
+        path: Union[Path, 'os.DirEntry[str]'],
+    ) -> List['os.DirEntry[str]']:
+        try:
+            with os.scandir(path) as entries:
+                return sorted(entries, key=lambda x: x.name)
+        except PermissionError:
+            return []
+
+    @classmethod
+    def _scan(
+        cls,
+        pool: concurrent.futures.Executor,
+        recursive: bool,
+        entries: Sequence[Union[Path, 'os.DirEntry[str]']],
+    ) -> Generator[Tuple[str, int, int], None, None]:
+        """
+        Directory entries cache file types and status from scandir.
+        """
+        directories = [
+            x
+            for x in entries
+            if recursive and x.is_dir() and not x.is_symlink()
+        ]
+        listings = {}
+        if len(directories) > 4:  # Read sibling directories concurrently
+            listings = dict(zip(
+                [os.fspath(x) for x in directories],
+                pool.map(cls._scandir, directories),
+            ))
+
+        for entry in entries:
+            if entry.is_dir():
+                if recursive and not entry.is_symlink():
+                    path = os.fspath(entry)
+                    try:
+                        yield from cls._scan(
+                            pool,
+                            recursive,
+                            (
+                                listings[path]
+                                if path in listings
+                                else cls._scandir(entry)
+                            ),
+                        )
+                    except PermissionError:
+                        pass
+            elif entry.is_file():
+                file_stat = entry.stat()
+                yield (
+                    str(Path(entry)),
+                    file_stat.st_size,
+                    int(file_stat.st_mtime),
+                )
+
+    @staticmethod
+    def _phash(key: Tuple[str, int, int]) -> Optional[str]:
+        import imagehash  # type: ignore
+        import PIL.Image  # type: ignore
+
+        file, size, _ = key
+        try:
+            if size > SMALL_IMAGE_SIZE:
+                return str(imagehash.phash(PIL.Image.open(file)))
+            # Single unbuffered read avoids format probe seeks/reads
+            with open(file, 'rb', buffering=0) as ifile:
+                data = ifile.read()
+            return str(imagehash.phash(PIL.Image.open(io.BytesIO(data))))
+        except OSError:
+            return None
 
     @classmethod
     def _update(
@@ -165,60 +223,102 @@ class Main:
         recursive: bool,
         paths: List[Path],
     ) -> dict:
+        """
+        PIL decoding releases the GIL so hash new images using threads
+        (loaded modules are not importable by process pool workers).
+        """
         logger.info("Updating checksums...")
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            keys = list(cls._scan(pool, recursive, paths))
+        new_keys = [x for x in keys if x not in phashes]
+        with concurrent.futures.ThreadPoolExecutor(os.cpu_count()) as pool:
+            calculated = dict(zip(new_keys, pool.map(cls._phash, new_keys)))
+
         new_phashes = {}
-        for path in paths:
-            if path.is_dir():
-                if recursive and not path.is_symlink():
-                    try:
-                        new_phashes.update(cls._update(
-                            phashes,
-                            recursive,
-                            sorted(path.iterdir()),
-                        ))
-                    except PermissionError:
-                        pass
-            elif path.is_file():
-                file_stat = FileStat(path)
-                key = (
-                     str(path),
-                     file_stat.get_size(), int(file_stat.get_mtime()),
-                )
-                if key in phashes:
-                    phash = phashes[key]
-                else:
-                    try:
-                        phash = str(imagehash.phash(PIL.Image.open(path)))
-                    except OSError:
-                        continue
+        for key in keys:
+            phash = phashes.get(key) or calculated.get(key)
+            if phash:
                 new_phashes[key] = phash
 
         return new_phashes
 
+    @staticmethod
+    def _distances(phashes: Any, phash: int) -> Any:
+        import numpy  # type: ignore
+
+        diffs = numpy.bitwise_xor(phashes, numpy.uint64(phash))
+        if hasattr(numpy, 'bitwise_count'):  # numpy >= 2.0
+            return numpy.bitwise_count(diffs)
+        return numpy.unpackbits(
+            diffs.view(numpy.uint8)
+        ).reshape(-1, 64).sum(axis=1)
+
+    @staticmethod
+    def _buckets(phashes: Any) -> List[Tuple[Any, Any]]:
+        """
+        Return (row order, sorted byte values) for each of the 8 hash bytes.
+        """
+        import numpy  # type: ignore
+
+        columns = phashes.view(numpy.uint8).reshape(-1, 8)
+        buckets = []
+        for column in columns.T:
+            order = numpy.argsort(column, kind='stable')
+            buckets.append((order, column[order]))
+        return buckets
+
+    @staticmethod
+    def _candidates(buckets: List[Tuple[Any, Any]], phash: int) -> Any:
+        """
+        Return rows sharing at least one hash byte in the same position.
+        """
+        import numpy  # type: ignore
+
+        values = numpy.array([phash], dtype=numpy.uint64).view(numpy.uint8)
+        return numpy.unique(numpy.concatenate([
+            order[
+                numpy.searchsorted(column, value):
+                numpy.searchsorted(column, value, side='right')
+            ]
+            for (order, column), value in zip(buckets, values)
+        ]))
+
     @classmethod
     def _check(cls, image_phashes: dict, new_phashes: Set[str]) -> None:
         """
-        Using BKTree to speed up check:
+        Using vectorized Hamming distance (XOR + popcount) to check:
         if phash1 - phash2 <= MAX_DISTANCE_IDENTICAL:
+
+        Pigeonhole principle: with less than 8 bits different at least one
+        of the 8 hash bytes is identical, so only rows sharing a byte value
+        in the same position are candidates.
         """
         logger.info("Checking checksums...")
-
-        phash_images: dict = {}
-        for key, value in image_phashes.items():
-            phash = int(value, 16)
-            file, _, _ = key
-            if phash in phash_images:
-                phash_images[phash].append(file)
-            else:
-                phash_images[phash] = [file]
+        if not new_phashes:
+            return
+        import numpy  # type: ignore
+
+        files = [x[0] for x in image_phashes]
+        phashes = numpy.fromiter(
+            (int(x, 16) for x in image_phashes.values()),
+            dtype=numpy.uint64,
+            count=len(image_phashes),
+        )
 
         matched_images = set()
-        tree = pybktree.BKTree(pybktree.hamming_distance, phash_images)
-        for phash in sorted([int(x, 16) for x in new_phashes]):
-            images = frozenset(itertools.chain.from_iterable([
-                phash_images[match]
-                for _, match in tree.find(phash, MAX_DISTANCE_IDENTICAL)
-            ]))
+        buckets = cls._buckets(phashes)
+        new = numpy.fromiter(
+            (int(x, 16) for x in new_phashes),
+            dtype=numpy.uint64,
+            count=len(new_phashes),
+        )
+        for phash in numpy.sort(new).tolist():
+            candidates = cls._candidates(buckets, phash)
+            matches = candidates[
+                cls._distances(phashes[candidates], phash) <=
+                MAX_DISTANCE_IDENTICAL
+            ]
+            images = frozenset(files[x] for x in matches)
             if len(images) > 1:
                 matched_images.add(images)
 
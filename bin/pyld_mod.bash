@@ -214,7 +214,9 @@ exec_python() {
 
     if [ -f "$PYLD_BIN/$PYLD_MAIN.py" ]
     then
-        exec "$PYTHON" -B -E "$PYLD_BIN/pyld_mod.py" $PYLD_FLAGS $PYLD_MAIN "$@"
+        # Cache bytecode in user cache instead of source directories
+        # (pyld_mod.py disables bytecode writing for Python < 3.8)
+        exec "$PYTHON" -E -X pycache_prefix="${XDG_CACHE_HOME:-$HOME/.cache}/pycache" "$PYLD_BIN/pyld_mod.py" $PYLD_FLAGS $PYLD_MAIN "$@"
     fi
 
     if [ "$PYLD_EXE" != "$PYLD_MAIN" ]
@@ -5,51 +5,48 @@ Python main program loader module
 Copyright GPL v2: 2006-2024 By Dr Colin Kong
 """
 
-import argparse
-import importlib.machinery
+import functools
 import importlib.util
 import os
 import signal
 import sys
 from pathlib import Path
-from typing import Any, List, Sequence, Union
+from typing import Any, List
 
 if sys.version_info < (3, 7) or sys.version_info >= (4, 0):
     sys.exit(__file__ + ": Requires Python version (>= 3.7, < 4.0).")
 if __name__ == '__main__':
-    sys.path = sys.path[1:] + sys.path[:1]
+    sys.path = [x for x in sys.path[1:] + sys.path[:1] if x]
 
 
 class Options:
     """
     This class handles Python loader commandline options.
 
-    self._args.module = Module name containing 'Main(args)' class
     self._dump_flag = Dump objects flag
     self._library_path = Python library path for debug modules
+    self._module = Module name containing 'Main(args)' class
     self._module_args = Arguments for 'Main(args)' class
     self._module_dir = Directory containing Python modules
     self._verbose_flag = Verbose flag
     """
+    _levels = {'-pyldv': 1, '-pyldvv': 2, '-pyldvvv': 3, '-pyldverbose': 1}
 
     def dump(self) -> None:
         """
         Dump object recursively.
         """
-        print('    "_options": {')
-        print('        "_args": {')
-        print('            "args":', str(self._args.args), ',')
-        print(f'            "libpath": {self._args.libpath},')
-        print(f'            "module":{self._args.module},')
-        print('            "verbosity":', self._args.verbosity)
-        print("        },")
-        print(f'        "_dump_flag": {self._dump_flag},')
-        print(f'        "_library_path": {self._library_path},')
-        print(f'        "_module_name": {self._module_name},')
-        print(f'        "_module_args": {self._module_args},')
-        print('        "_module_dir": "', self._module_dir, '",')
-        print('        "_verbose_flag":', self._verbose_flag)
-        print("    },")
+        print('\n'.join([
+            '    "_options": {',
+            f'        "_dump_flag": {self._dump_flag},',
+            f'        "_library_path": {self._library_path},',
+            f'        "_module": {self._module},',
+            f'        "_module_name": {self._module_name},',
+            f'        "_module_args": {self._module_args},',
+            f'        "_module_dir": "{self._module_dir}",',
+            f'        "_verbose_flag": {self._verbose_flag}',
+            '    },',
+        ]))
 
     def __init__(self, args: List[str]) -> None:
         """
@@ -74,7 +71,7 @@ class Options:
         """
         Return module name containing 'Main(args)' class
         """
-        return self._args.module[0]
+        return self._module
 
     def get_module_name(self) -> str:
         """
@@ -101,34 +98,63 @@ class Options:
         return self._verbose_flag
 
     def _parse_args(self, args: List[str]) -> None:
+        options: dict = {'verbosity': 0, 'name': None, 'path': None}
+        mod_args = []
+        iargs = iter(args)
+        for arg in iargs:
+            if arg in self._levels:
+                options['verbosity'] = self._levels[arg]
+            elif arg in ('-pyldname', '-pyldpath'):
+                options[arg[5:]] = next(iargs, '')
+            elif arg.startswith(('-pyldname=', '-pyldpath=')):
+                options[arg[5:9]] = arg[10:]
+            else:
+                mod_args.append(arg)
+        if (
+            not mod_args or
+            mod_args[0].startswith('-') or
+            '' in options.values()
+        ):
+            self._usage(args)
+
+        self._verbose_flag = options['verbosity'] >= 1
+        self._dump_flag = options['verbosity'] >= 2
+        module = mod_args[0]
+        self._module = module[:-3] if module.endswith('.py') else module
+        self._module_name = options['name'] or module
+        self._module_args = mod_args[1:]
+        self._library_path = (
+            options['path'].split(os.pathsep) if options['path'] else []
+        )
+
+    @staticmethod
+    def _usage(args: List[str]) -> None:
+        import argparse  # pylint: disable=import-outside-toplevel
+
         parser = argparse.ArgumentParser(
             description="Load Python main program as module "
             "(must have Main class).",
         )
 
-        parser.add_argument(
-            '-pyldv',
-            '-pyldvv',
-            '-pyldvvv',
-            nargs=0,
-            action=ArgparseVerboseAction,
-            dest='verbosity',
-            default=0,
-            help="Select verbosity level 1, 2 or 3.",
-        )
+        for flag, level in (('-pyldv', 1), ('-pyldvv', 2), ('-pyldvvv', 3)):
+            parser.add_argument(
+                flag,
+                action='store_const',
+                const=level,
+                dest='verbosity',
+                help=f"Select verbosity level {level}.",
+            )
         parser.add_argument(
             '-pyldverbose',
             action='store_const',
             const=1,
             dest='verbosity',
-            default=0,
             help="Select verbosity level 1.",
         )
         parser.add_argument(
             '-pyldname',
             nargs=1,
             dest='name',
-            default=None,
             help="Select module name.",
         )
         parser.add_argument(
@@ -149,62 +175,8 @@ class Options:
             help="Module argument.",
         )
 
-        py_args = []
-        mod_args = []
-        while args:
-            if args[0] in {
-                '-pyldv',
-                '-pyldvv',
-                '-pyldvvv',
-                '-pyldverbose',
-                '-pyldname',
-                '-pyldpath'
-            }:
-                py_args.append(args[0])
-                if args[0] in ('-pyldname', '-pyldpath') and len(args) >= 2:
-                    args = args[1:]
-                    py_args.append(args[0])
-            elif (
-                    args[0].startswith('-pyldname=') or
-                    args[0].startswith('-pyldpath=')
-            ):
-                py_args.extend(args[0].split('=', 1))
-            else:
-                mod_args.append(args[0])
-            args = args[1:]
-        py_args.extend(mod_args[:1])
-
-        self._args = parser.parse_args(py_args)
-
-        self._verbose_flag = self._args.verbosity >= 1
-        self._dump_flag = self._args.verbosity >= 2
-        self._module_name = (
-            self._args.name[0] if self._args.name else self._args.module[0]
-        )
-        self._module_args = mod_args[1:]
-        self._library_path = (
-            self._args.libpath[0].split(os.pathsep)
-            if self._args.libpath
-            else []
-        )
-
-
-class ArgparseVerboseAction(  # pylint: disable=too-few-public-methods
-    argparse.Action,
-):
-    """
-    Arg parser verbose action handler class
-    """
-
-    def __call__(
-        self,
-        parser: argparse.ArgumentParser,
-        args: argparse.Namespace,
-        values: Union[str, Sequence[Any], None],
-        option_string: str = None,
-    ) -> None:
-        # option_string must be '-pyldv', '-pyldvv' or '-pldyvvv'
-        setattr(args, self.dest, len(option_string[5:]))
+        parser.parse_args(args)
+        parser.error('invalid module name or option value')
 
 
 class PythonLoader:
@@ -221,8 +193,7 @@ class PythonLoader:
         """
         print('"pyloader": {')
         self._options.dump()
-        print('    "_sysArgv":', self._sys_argv)
-        print("}")
+        print(f'    "_sysArgv": {self._sys_argv}\n}}')
 
     def __init__(self, options: Options) -> None:
         """
@@ -241,12 +212,11 @@ class PythonLoader:
             os.environ['PATH'] = os.pathsep.join([str(path)] + directories)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _load_module(file: str) -> Any:
-        loader = importlib.machinery.SourceFileLoader('module.name', file)
-        main = importlib.util.module_from_spec(
-            importlib.util.spec_from_loader(loader.name, loader)
-        )
-        loader.exec_module(main)
+        spec = importlib.util.spec_from_file_location('module.name', file)
+        main = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(main)  # type: ignore
         return main
 
     def run(self) -> None:
@@ -265,9 +235,6 @@ class PythonLoader:
             sys.path.append(directory)
 
         module = self._options.get_module()
-        if module.endswith('.py'):
-            module = module[:-3]
-
         sys.argv = self._sys_argv
         if self._options.get_verbose_flag():
             print("sys.argv =", sys.argv)
@@ -310,6 +277,8 @@ class Main:
         """
         if hasattr(signal, 'SIGPIPE'):
             signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+        if sys.version_info < (3, 8):  # No "-X pycache_prefix" support
+            sys.dont_write_bytecode = True
         if os.linesep != '\n':
             def _open(file, *args, **kwargs):  # type: ignore
                 if 'newline' not in kwargs and args and 'b' not in args[0]:
@@ -4,7 +4,6 @@ Copy CD/DVD data as a portable ISO/BIN image file.
 """
 
 import argparse
-import glob
 import logging
 import os
 import signal
@@ -137,16 +136,28 @@ class Cdrom:
         """
         Detect devices
         """
-        for directory in glob.glob('/sys/block/sr*/device'):
-            device = f'/dev/{Path(directory).parent.name}'
+        try:
+            entries = [
+                x for x in os.scandir('/sys/block') if x.name.startswith('sr')
+            ]
+        except OSError:
+            return
+        for entry in entries:
             model = ''
             for file in ('vendor', 'model'):
                 try:
-                    with Path(directory, file).open(errors='replace') as ifile:
-                        model += f' {ifile.readline().strip()}'
+                    fd = os.open(f'{entry.path}/device/{file}', os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    data = os.read(fd, 256)
                 except OSError:
                     continue
-            self._devices[device] = model
+                finally:
+                    os.close(fd)
+                model += f" {data.decode(errors='replace').strip()}"
+            if model or os.path.isdir(f'{entry.path}/device'):
+                self._devices[f'/dev/{entry.name}'] = model
 
 
 class Main:
@@ -248,8 +259,11 @@ class Main:
 
         isoinfo.set_args(['-d', '-i', file])
         task = Batch(isoinfo.get_cmdline())
-        task.run(pattern='^Volume size is: ')
-        if not task.has_output():
+        task.run()
+        for line in task.get_error():
+            print(line, file=sys.stderr)
+        volume = task.get_output('^Volume size is: ')
+        if not volume:
             raise SystemExit(
                 f'{sys.argv[0]}: Cannot find TOC on CD/DVD media. '
                 'Disk not recognised.',
@@ -259,15 +273,10 @@ class Main:
                 f'{sys.argv[0]}: Error code {task.get_exitcode()} '
                 f'received from "{task.get_file()}".',
             )
-        blocks = int(task.get_output()[0].split()[-1])
-
-        task2 = Task(isoinfo.get_cmdline())
-        task2.run(pattern=' id: $')
-        if task2.get_exitcode():
-            raise SystemExit(
-                f'{sys.argv[0]}: Error code {task2.get_exitcode()} '
-                f'received from "{task2.get_file()}".',
-            )
+        blocks = int(volume[0].split()[-1])
+        for line in task.get_output():
+            if not line.endswith(' id: '):
+                print(line)
 
         print(f'Creating ISO image file "{file}"...')
         command.set_args([
@@ -285,12 +294,13 @@ class Main:
             raise SystemExit(
                 f'{sys.argv[0]}: Cannot find CD/DVD media. Please check drive.'
             )
-        pad = int(blocks * 2048 - Path(file).stat().st_size)
+        size = Path(file).stat().st_size
+        pad = blocks * 2048 - size
         if 0 < pad < 16777216:
             print(pad, 'bytes flushing from CD/DVD prefetch bug...')
-            with Path(file).open('ab') as ofile:
-                ofile.write(b"\0" * pad)
-        self._isosize(file, Path(file).stat().st_size)
+            os.truncate(file, blocks * 2048)
+            size += pad
+        self._isosize(file, size)
 
     @staticmethod
     def _isosize(image: str, size: int) -> None:
@@ -50,10 +50,6 @@ class Options:
         """
         self._parse_args(args[1:])
 
-        self._directories = []
-        for path in [Path(x) for x in args[1:]]:
-            self._directories.append(str(path.resolve()))
-
 
 class Main:
     """
@@ -94,18 +90,21 @@ class Main:
         mount = Command('mount', errors='stop')
         fusermount = Command('fusermount', errors='stop')
 
+        task = Batch(mount.get_cmdline())
+        task.run(pattern=' type fuse.sshfs ')
+        if task.get_exitcode():
+            raise SystemExit(
+                f'{sys.argv[0]}: Error code {task.get_exitcode()} '
+                f'received from "{task.get_file()}".',
+            )
+        mounts = task.get_output()
+
         for directory in directories:
-            task = Batch(mount.get_cmdline())
-            task.run(pattern=f' {directory} type fuse.sshfs ')
-            if not task.has_output():
+            pattern = f' {directory} type fuse.sshfs '
+            if not [x for x in mounts if pattern in x]:
                 raise SystemExit(
                     f'{sys.argv[0]}: "{directory}" is not a mount point.',
                 )
-            if task.get_exitcode():
-                raise SystemExit(
-                    f'{sys.argv[0]}: Error code {task.get_exitcode()} '
-                    f'received from "{task.get_file()}".',
-                )
             fusermount.set_args(['-u', directory])
             Task(fusermount.get_cmdline()).run()
 
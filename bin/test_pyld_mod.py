@@ -123,6 +123,17 @@ class TestOptions(
         result = options.get_module()
         self.assertEqual(result, expected)
 
+    def test_get_module_py(self) -> None:
+        """
+        Test module name has '.py' extension removed.
+        """
+        expected = 'moduleX'
+        args = ['arg0', 'moduleX.py']
+        options = pyld_mod.Options(args)
+
+        result = options.get_module()
+        self.assertEqual(result, expected)
+
     def test_get_module_name_default(self) -> None:
         """
         Test getting module name default.
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test module for 'untar_py.py' module
+"""
+
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+
+import untar_py
+
+
+class TestMain(unittest.TestCase):
+    """
+    This class tests Main class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setup test harness.
+        """
+        self._cwd = os.getcwd()
+        # pylint: disable=consider-using-with
+        self._tmpdir = tempfile.TemporaryDirectory()
+        # pylint: enable=consider-using-with
+        self._directory = Path(self._tmpdir.name, 'target')
+        self._directory.mkdir()
+        os.chdir(self._directory)
+
+    def tearDown(self) -> None:
+        """
+        Remove test harness.
+        """
+        os.chdir(self._cwd)
+        self._tmpdir.cleanup()
+
+    @staticmethod
+    def _archive(name: str) -> tarfile.TarFile:
+        data = b'data\n'
+        ofile = io.BytesIO()
+        with tarfile.open(fileobj=ofile, mode='w') as archive:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+        ofile.seek(0)
+        return tarfile.open(fileobj=ofile)
+
+    def test_unpack(self) -> None:
+        """
+        Test member inside current directory is extracted.
+        """
+        with self._archive('./x') as archive:
+            untar_py.Main._unpack(archive)  # pylint: disable=protected-access
+
+        self.assertTrue(Path(self._directory, 'x').is_file())
+
+    def test_unpack_pardir(self) -> None:
+        """
+        Test member with '..' path is rejected.
+        """
+        with self._archive('../x') as archive:
+            with self.assertRaises(SystemExit):
+                untar_py.Main._unpack(  # pylint: disable=protected-access
+                    archive,
+                )
+
+        self.assertFalse(Path(self._tmpdir.name, 'x').exists())
+
+    def test_unpack_curdir_pardir(self) -> None:
+        """
+        Test member with './..' path is rejected.
+        """
+        with self._archive('./../x') as archive:
+            with self.assertRaises(SystemExit):
+                untar_py.Main._unpack(  # pylint: disable=protected-access
+                    archive,
+                )
+
+        self.assertFalse(Path(self._tmpdir.name, 'x').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ Wait for task to finish then launch command.
 """
 
 import argparse
+import os
+import select
 import signal
 import sys
 import time
@@ -123,7 +125,19 @@ class Main:
             signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
     @staticmethod
-    def run() -> int:
+    def _wait_pid(pid: int) -> bool:
+        try:
+            pidfd = os.pidfd_open(pid)  # type: ignore
+        except (AttributeError, OSError):
+            return False
+        try:
+            select.select([pidfd], [], [])
+        finally:
+            os.close(pidfd)
+        return True
+
+    @classmethod
+    def run(cls) -> int:
         """
         Start program
         """
@@ -137,8 +151,12 @@ class Main:
                 time.sleep(1)
         else:
             pid = options.get_pid()
-            while pid in Tasks.factory(user).get_pids():
-                time.sleep(1)
+            if (
+                pid in Tasks.factory(user).get_pids() and
+                not cls._wait_pid(pid)
+            ):
+                while pid in Tasks.factory(user).get_pids():
+                    time.sleep(1)
         Exec(options.get_command().get_cmdline()).run()
 
         return 0
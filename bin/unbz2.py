@@ -53,7 +53,9 @@ class Options:
         """
         self._parse_args(args[1:])
 
-        self._bzip2 = Command('bzip2', errors='stop')
+        self._bzip2 = Command('lbzip2', errors='ignore')
+        if not self._bzip2.is_found():
+            self._bzip2 = Command('bzip2', errors='stop')
 
         if self._args.test_flag:
             self._bzip2.set_args(['-t'])
@@ -87,8 +87,9 @@ class Main:
         with sqlite3.connect(file) as conn:
             print(f"{file}:")
             try:
-                for line in conn.iterdump():
-                    print("   ", line)
+                conn.execute('PRAGMA query_only = ON')
+                conn.execute('PRAGMA mmap_size = 1073741824')
+                sys.stdout.writelines(f'    {x}\n' for x in conn.iterdump())
             except sqlite3.DatabaseError as exception:
                 raise SystemExit(f'{sys.argv[0]}: {exception}') from exception
 
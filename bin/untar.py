@@ -95,6 +95,13 @@ class Main:
 
         os.umask(0o022)
 
+    @staticmethod
+    def _get_unpacker(preferred: str, fallback: str, args: list) -> Command:
+        unpacker = Command(preferred, args=args, errors='ignore')
+        if not unpacker.is_found():
+            unpacker = Command(fallback, args=args)
+        return unpacker
+
     def _unpack(self, file: str) -> None:
         task: Task
 
@@ -107,9 +114,9 @@ class Main:
         elif file.endswith(('.tar.zst', '.tar.zstd', '.tzs', '.tzst')):
             unpacker = Command('zstd', args=['-d', '-c'])
         elif file.endswith(('.tar.bz2', '.tbz')):
-            unpacker = Command('bzip2', args=['-d', '-c'])
+            unpacker = self._get_unpacker('lbzip2', 'bzip2', ['-d', '-c'])
         elif file.endswith(('.tar.gz', '.tgz')):
-            unpacker = Command('gzip', args=['-d', '-c'])
+            unpacker = self._get_unpacker('pigz', 'gzip', ['-d', '-c'])
         elif file.endswith(('.tar')):
             unpacker = Command('cat')
         else:
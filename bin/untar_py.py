@@ -94,28 +94,25 @@ class Main:
 
     @staticmethod
     def _unpack(archive: tarfile.TarFile) -> None:
-        for path in [Path(x) for x in archive.getnames()]:
-            print(path)
-            if path.is_absolute():
+        for member in archive.getmembers():
+            name = os.path.normpath(member.name)
+            print(name)
+            if os.path.isabs(name):
                 raise SystemExit(
                     f'{sys.argv[0]}: Unsafe to extract file with absolute '
                     'path outside of current directory.'
                 )
-            if str(path).startswith(os.pardir):
+            if name.startswith(os.pardir):
                 raise SystemExit(
                     f'{sys.argv[0]}: Unsafe to extract file with relative '
                     'path outside of current directory.'
                 )
             try:
-                archive.extract(archive.getmember(str(path)))
+                archive.extract(member)
             except OSError as exception:
                 raise SystemExit(
-                    f'{sys.argv[0]}: Unable to create "{path}" extracted.',
+                    f'{sys.argv[0]}: Unable to create "{name}" extracted.',
                 ) from exception
-            if not path.exists():
-                raise SystemExit(
-                    f'{sys.argv[0]}: Cannot create extracted "{path}" file.',
-                )
 
     @staticmethod
     def _view(archive: tarfile.TarFile) -> None:
@@ -129,22 +126,22 @@ class Main:
         options = Options()
 
         for file in options.get_archives():
-            if file.endswith(('.tar.xz', '.txz', )):
-                mode = 'r:xz'
-            elif file.endswith(('.tar.bz2', '.tbz', )):
-                mode = 'r:bz2'
-            elif file.endswith(('.tar.gz', '.tgz', )):
-                mode = 'r:gz'
-            elif file.endswith('.tar'):
-                mode = 'r'
-            else:
+            if not file.endswith((
+                '.tar.xz',
+                '.txz',
+                '.tar.bz2',
+                '.tbz',
+                '.tar.gz',
+                '.tgz',
+                '.tar',
+            )):
                 raise SystemExit(
                     f'{sys.argv[0]}: Unsupported "{file}" archive format.',
                 )
 
             print(f"{file}:")
             try:
-                with tarfile.open(file, mode) as archive:
+                with tarfile.open(file, 'r:*') as archive:
                     if options.get_view_flag():
                         cls._view(archive)
                     else:
@@ -4,6 +4,7 @@ Unpack a compressed archive using suitable tool.",
 """
 
 import argparse
+import functools
 import os
 import signal
 import sys
@@ -92,6 +93,11 @@ class Main:
 
         os.umask(0o022)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_command(name: str) -> Command:
+        return Command(name, errors='stop')
+
     @classmethod
     def run(cls) -> int:
         """
@@ -120,7 +126,7 @@ class Main:
                 '.txz',
                 '.t7z',
             )):
-                command = Command('untar', errors='stop')
+                command = cls._get_command('untar')
             elif suffix in (
                 '.ace',
                 '.deb',
@@ -130,14 +136,14 @@ class Main:
                 '.zst',
                 '.zstd',
             ):
-                command = Command(f'un{suffix[1:]}', errors='stop')
+                command = cls._get_command(f'un{suffix[1:]}')
             elif suffix in ('.pyc', 'unsqlite'):
-                command = Command(f'un{suffix[1:]}', errors='stop')
+                command = cls._get_command(f'un{suffix[1:]}')
                 args = [path]
             elif suffix == 'initr':
-                command = Command('uninitrd', errors='stop')
+                command = cls._get_command('uninitrd')
             else:
-                command = Command('un7z', errors='stop')
+                command = cls._get_command('un7z')
             cmdline = command.get_cmdline() + args
             print(f"\nRunning: {command.args2cmd(cmdline)}")
             task = Task(cmdline)
@@ -7,7 +7,7 @@ import os
 import signal
 import sys
 from pathlib import Path
-from typing import BinaryIO, List, TextIO, Union
+from typing import List
 
 from command_mod import Command
 from subtask_mod import Background
@@ -35,47 +35,36 @@ class Options:
 
     @staticmethod
     def _config() -> None:
-        home = Path.home()
-        path = Path(home, '.vmware', 'config')
-        ofile: Union[BinaryIO, TextIO]
+        path = Path(Path.home(), '.vmware', 'config')
+        line = b'xkeymap.nokeycodeMap = true\n'
 
+        configdata = b''
         if path.is_file():
             try:
-                with path.open(errors='replace') as ifile:
-                    configdata = ifile.readlines()
+                configdata = path.read_bytes()
             except OSError as exception:
                 raise SystemExit(
                     f'{sys.argv[0]}: Cannot read '
                     f'"{path}" configuration file.',
                 ) from exception
-            if 'xkeymap.nokeycodeMap = true\n' in configdata:
-                ifile.close()
+            if line.strip() in [x.strip() for x in configdata.splitlines()]:
                 return
-            try:
-                with path.open('a', errors='replace') as ofile:
-                    print("xkeymap.nokeycodeMap = true", file=ofile)
-            except OSError as exception:
-                raise SystemExit(
-                    f'{sys.argv[0]}: Cannot modify '
-                    f'"{path}" configuration file.',
-                ) from exception
-        else:
-            if not path.parent.is_dir():
-                try:
-                    path.parent.mkdir()
-                except OSError as exception:
-                    raise SystemExit(
-                        f'{sys.argv[0]}: Cannot create '
-                        f'"{path.parent}" directory.',
-                    ) from exception
-            try:
-                with path.open('w') as ofile:
-                    print("xkeymap.nokeycodeMap = true", file=ofile)
-            except OSError as exception:
-                raise SystemExit(
-                    f'{sys.argv[0]}: Cannot create '
-                    f'"{path}" configuration file.',
-                ) from exception
+            if configdata and not configdata.endswith(b'\n'):
+                line = b'\n' + line
+
+        try:
+            path.parent.mkdir(exist_ok=True)
+        except OSError as exception:
+            raise SystemExit(
+                f'{sys.argv[0]}: Cannot create "{path.parent}" directory.',
+            ) from exception
+        try:
+            with path.open('ab') as ofile:
+                ofile.write(line)
+        except OSError as exception:
+            raise SystemExit(
+                f'{sys.argv[0]}: Cannot modify "{path}" configuration file.',
+            ) from exception
 
     def parse(self, args: List[str]) -> None:
         """
@@ -11,7 +11,7 @@ import shutil
 import sys
 import types
 from pathlib import Path
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 from subtask_mod import Batch, Task
 from command_mod import Command
@@ -110,7 +110,16 @@ class Main:
             Path.open = _open  # type: ignore
 
     @staticmethod
-    def run() -> int:
+    def _get_resolution(xrandr: Command) -> Optional[int]:
+        task = Batch(xrandr.get_cmdline())
+        task.run(pattern='^  ')
+        return next(
+            (i for i, line in enumerate(task.get_output()) if '*' in line),
+            None,
+        )
+
+    @classmethod
+    def run(cls) -> int:
         """
         Start program
         """
@@ -118,24 +127,12 @@ class Main:
 
         wine = options.get_wine()
         xrandr = Command('xrandr', errors='stop')
-        task = Batch(xrandr.get_cmdline())
-        task.run(pattern='^  ')
-        orig_resolution = 0
-        for line in task.get_output():
-            if '*' in line:
-                break
-            orig_resolution += 1
+        orig_resolution = cls._get_resolution(xrandr)
 
         Task(wine.get_cmdline()).run()
 
-        task = Batch(xrandr.get_cmdline())
-        task.run(pattern='^  ')
-        new_resolution = 0
-        for line in task.get_output():
-            if '*' in line:
-                break
-            new_resolution += 1
-        if new_resolution != orig_resolution:
+        new_resolution = cls._get_resolution(xrandr)
+        if orig_resolution is not None and new_resolution != orig_resolution:
             xrandr.set_args(['-s', orig_resolution])
             Batch(xrandr.get_cmdline()).run()
 
@@ -3,12 +3,10 @@
 Make a compressed archive using suitable tool.
 """
 
-import argparse
-import os
 import signal
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from command_mod import Command
 from subtask_mod import Exec, Task
@@ -20,22 +18,25 @@ class Options:
     """
 
     def __init__(self) -> None:
-        self._args: argparse.Namespace = None
+        self._archive = ''
+        self._files: List[str] = []
         self.parse(sys.argv)
 
     def get_archive(self) -> str:
         """
         Return archive location.
         """
-        return self._args.archive[0]
+        return self._archive
 
     def get_files(self) -> List[Path]:
         """
         Return list of files.
         """
-        return [Path(x) for x in self._args.files]
+        return [Path(x) for x in self._files]
 
     def _parse_args(self, args: List[str]) -> None:
+        import argparse  # pylint: disable=import-outside-toplevel
+
         parser = argparse.ArgumentParser(
             description="Make a compressed archive using suitable tool.",
         )
@@ -53,19 +54,45 @@ class Options:
             help="File or directory.",
         )
 
-        self._args = parser.parse_args(args)
+        parsed_args = parser.parse_args(args)
+        self._archive = parsed_args.archive[0]
+        self._files = parsed_args.files
 
     def parse(self, args: List[str]) -> None:
         """
         Parse arguments
         """
-        self._parse_args(args[1:])
+        if len(args) < 2 or any(x.startswith('-') for x in args[1:]):
+            self._parse_args(args[1:])
+        else:
+            self._archive = args[1]
+            self._files = args[2:]
 
 
 class Main:
     """
     Main class
     """
+    _archivers = {
+        'tar': 'tar.py',
+        'tar.gz': 'tar.py',
+        'tar.bz2': 'tar.py',
+        'tar.zst': 'tar.py',
+        'tar.zstd': 'tar.py',
+        'tar.lzma': 'tar.py',
+        'tar.xz': 'tar.py',
+        'tar.7z': 'tar.py',
+        'tgz': 'tar.py',
+        'tbz': 'tar.py',
+        'tzs': 'tar.py',
+        'tzst': 'tar.py',
+        'tlz': 'tar.py',
+        'txz': 'tar.py',
+        't7z': 'tar.py',
+        'zip': 'zip.py',
+        '7z': '7z.py',
+        'exe': '7z.py',
+    }
 
     def __init__(self) -> None:
         try:
@@ -83,12 +110,14 @@ class Main:
         """
         if hasattr(signal, 'SIGPIPE'):
             signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-        if os.linesep != '\n':
-            def _open(file, *args, **kwargs):  # type: ignore
-                if 'newline' not in kwargs and args and 'b' not in args[0]:
-                    kwargs['newline'] = '\n'
-                return open(str(file), *args, **kwargs)
-            Path.open = _open  # type: ignore
+
+    @classmethod
+    def _get_archiver(cls, name: str) -> Optional[str]:
+        suffixes = name.split('.')[1:]
+        return cls._archivers.get(
+            '.'.join(suffixes[-2:]),
+            cls._archivers.get(suffixes[-1] if suffixes else ''),
+        )
 
     @classmethod
     def run(cls) -> None:
@@ -100,49 +129,36 @@ class Main:
         files = options.get_files()
 
         name = path.name.replace('-new', '')
-        if name.endswith((
-            '.tar',
-            '.tar.gz',
-            '.tar.bz2',
-            '.tar.zst',
-            '.tar.zstd',
-            '.tar.lzma',
-            '.tar.xz',
-            '.tar.7z',
-            '.tgz',
-            '.tbz',
-            '.tzs',
-            '.tzst',
-            '.tlz',
-            '.txz',
-            '.t7z',
-        )):
-            command = Command('tar.py', errors='stop')
-        elif name.endswith('.zip'):
-            command = Command('zip.py', errors='stop')
-        elif name.endswith(('.7z', '.exe')) or path.is_dir():
-            command = Command('7z.py', errors='stop')
-            if path.is_dir() and all(x.is_dir() for x in files):
-                for directory in [path] + files:
-                    if directory.is_absolute() or len(directory.parts) < 1:
-                        task = Task(command.get_cmdline() + [directory])
-                    else:
-                        task = Task(command.get_cmdline() + [
-                            f"../{'-'.join(directory.parts)}.7z",
-                            directory,
-                        ])
-                    task.run()
-                    if task.get_exitcode():
-                        raise SystemExit(
-                            f'{sys.argv[0]}: Error code {task.get_exitcode()} '
-                            f'received from "{task.get_file()}".',
-                        )
-                return
-        else:
+        archiver = cls._get_archiver(name)
+        if not archiver and path.is_dir():
+            archiver = '7z.py'
+        elif not archiver:
             raise SystemExit(
                 f"{sys.argv[0]}: Unable to make unsupported archive format:"
                 f"{name}"
             )
+        command = Command(archiver, errors='stop')
+
+        if (
+            archiver == '7z.py' and
+            path.is_dir() and
+            all(x.is_dir() for x in files)
+        ):
+            for directory in [path] + files:
+                if directory.is_absolute() or len(directory.parts) < 1:
+                    task = Task(command.get_cmdline() + [directory])
+                else:
+                    task = Task(command.get_cmdline() + [
+                        f"../{'-'.join(directory.parts)}.7z",
+                        directory,
+                    ])
+                task.run()
+                if task.get_exitcode():
+                    raise SystemExit(
+                        f'{sys.argv[0]}: Error code {task.get_exitcode()} '
+                        f'received from "{task.get_file()}".',
+                    )
+            return
 
         command.set_args([path] + files)
         Exec(command.get_cmdline()).run()